@@ -3,6 +3,10 @@ This package provides internal utility functions for the LLM ETL pipeline's
 transformation phase.
 """
 
-from llm_etl_pipeline.transformation.internal.utils import _cluster_list_sents
+from llm_etl_pipeline.transformation.internal.utils import (
+    _cluster_list_sents,
+    _compile_regex,
+    _get_non_string_indices,
+)
 
-__all__ = ["_cluster_list_sents"]
+__all__ = ["_cluster_list_sents", "_compile_regex", "_get_non_string_indices"]
@@ -5,15 +5,33 @@ It uses Sentence-BERT for generating sentence embeddings and Agglomerative Clust
 to group similar sentences. The primary function `_cluster_list_sents` then
 selects the longest sentence from each cluster as its representative, effectively
 reducing redundancy in a list of semantically similar sentences.
+
+It also provides `_compile_regex`, a cached compiler for the regex patterns used
+by the regex-based validation and filtering functions. Setting the
+`PROJECT_REGEX_BACKEND` environment variable to "re2" compiles patterns with
+Google RE2 (linear-time matching, no catastrophic backtracking) when the optional
+`google-re2` package is installed, falling back to Python's `re` otherwise.
+
+Finally, `_get_non_string_indices` locates the non-string elements of a Series,
+shared by the string and regex validation and filtering functions.
 """
 
+import os
+import re
+from functools import lru_cache
+
 import pandas as pd
+from pandas.api.types import infer_dtype
 from sentence_transformers import SentenceTransformer
 from sklearn.cluster import AgglomerativeClustering
 
 from llm_etl_pipeline.customized_logger import logger
 from llm_etl_pipeline.typings import NonEmptyListStr
 
+# Dynamically select the regex engine with an env var ("re" or "re2")
+REGEX_BACKEND_ENV_VAR_NAME = "PROJECT_REGEX_BACKEND"
+DEFAULT_REGEX_BACKEND = "re"
+
 
 def _cluster_list_sents(
     input_list: NonEmptyListStr = None,
@@ -109,3 +127,103 @@ def _cluster_list_sents(
         )
 
     return result_list
+
+
+def _compile_regex(regex_pattern: str):
+    """
+    Compiles and caches a regular expression with the flags shared by all
+    regex-based transformation functions (`re.IGNORECASE` and `re.DOTALL`).
+
+    Pipelines typically apply the same pattern over many calls, so compiled
+    objects are cached per pattern and backend. The engine is chosen through the
+    `PROJECT_REGEX_BACKEND` environment variable (see `_compile_regex_for_backend`).
+
+    Args:
+        regex_pattern (str): The regular expression pattern to compile.
+
+    Returns:
+        The compiled regular expression, exposing a `re.Pattern`-like `search` method.
+
+    Raises:
+        re.error: If the pattern has invalid syntax.
+    """
+    backend = os.getenv(REGEX_BACKEND_ENV_VAR_NAME, DEFAULT_REGEX_BACKEND)
+    return _compile_regex_for_backend(regex_pattern, backend.strip().lower())
+
+
+@lru_cache(maxsize=256)
+def _compile_regex_for_backend(regex_pattern: str, backend: str):
+    """
+    Compiles a regular expression with the requested engine.
+
+    With `backend="re2"`, the pattern is compiled by Google RE2, whose automaton
+    based matching runs in linear time regardless of alternation depth. RE2 does
+    not support every Python construct (e.g. backreferences or lookarounds); such
+    patterns, a missing `google-re2` package (not a declared dependency; install
+    it separately), or an unknown backend name all fall back to Python's `re`
+    with a warning.
+
+    Args:
+        regex_pattern (str): The regular expression pattern to compile.
+        backend (str): The regex engine to use, either "re" or "re2".
+
+    Returns:
+        The compiled regular expression, exposing a `re.Pattern`-like `search` method.
+
+    Raises:
+        re.error: If the pattern has invalid syntax.
+    """
+    if backend == "re2":
+        try:
+            import re2  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            logger.warning(
+                "Regex backend 're2' requested but 'google-re2' is not installed. "
+                "Falling back to Python 're'."
+            )
+        else:
+            options = re2.Options()
+            options.case_sensitive = False
+            options.dot_nl = True
+            options.log_errors = False
+            try:
+                return re2.compile(regex_pattern, options)
+            except re2.error:
+                logger.warning(
+                    f"Regex '{regex_pattern}' is not supported by RE2. "
+                    "Falling back to Python 're'."
+                )
+    elif backend != "re":
+        logger.warning(
+            f"Unknown regex backend '{backend}'. Expected 're' or 're2'. "
+            "Falling back to Python 're'."
+        )
+    return re.compile(regex_pattern, re.IGNORECASE | re.DOTALL)
+
+
+def _get_non_string_indices(values: pd.Series) -> list:
+    """
+    Returns the index labels of the elements of a Series that are not strings.
+
+    `infer_dtype` is only used as a fast accept: a single C-level scan that reports
+    "string" for object columns holding nothing but strings, and for every
+    StringDtype column. Any other result (e.g. "categorical" for a category column
+    of strings) falls back to a per-element isinstance check, so only elements
+    that are really not strings are reported.
+
+    Missing values are not reliably reported: a StringDtype column is accepted
+    even when it holds `pd.NA`. Callers must reject nulls before calling this
+    helper, as all current callers do.
+
+    Args:
+        values (pd.Series): The Series whose elements should be checked. It is
+                            expected to contain no missing values.
+
+    Returns:
+        list: The index labels of the non-string elements, in order. Empty if every
+              element is a string.
+    """
+    if infer_dtype(values, skipna=False) == "string":
+        return []
+    non_string_mask = [not isinstance(value, str) for value in values]
+    return values.index[non_string_mask].tolist()
@@ -9,7 +9,6 @@ and flexible row dropping based on specified criteria. It also offers functions
 reduce lists to unique elements and to group data by document IDs for aggregation.
 """
 
-import re
 from typing import Union
 
 import numpy as np
@@ -20,7 +19,11 @@ from sentence_transformers import SentenceTransformer
 from sklearn.cluster import AgglomerativeClustering
 
 from llm_etl_pipeline.customized_logger import logger
-from llm_etl_pipeline.transformation.internal import _cluster_list_sents
+from llm_etl_pipeline.transformation.internal import (
+    _cluster_list_sents,
+    _compile_regex,
+    _get_non_string_indices,
+)
 from llm_etl_pipeline.typings import (
     NonEmptyDataFrame,
     NonEmptyListStr,
@@ -177,7 +180,7 @@ def drop_rows_not_satisfying_regex(
 
     df = input_df.copy()
     initial_rows = len(df)
-    compiled_regex = re.compile(regex_pattern, re.IGNORECASE | re.DOTALL)
+    compiled_regex = _compile_regex(regex_pattern)
     columns_to_check_copy = columns_to_check.copy()
 
     logger.info(
@@ -186,7 +189,7 @@ def drop_rows_not_satisfying_regex(
         f"Columns to check: {columns_to_check_copy}"
     )
 
-    rows_to_drop_indices = set()
+    keep_mask = np.ones(initial_rows, dtype=bool)
 
     for col in columns_to_check_copy:
         if col not in df.columns:
@@ -220,9 +223,8 @@ def drop_rows_not_satisfying_regex(
             )
 
         # Check if all values are actually strings (after ensuring no nulls)
-        non_string_elements = df[col].apply(lambda x: not isinstance(x, str))
-        if non_string_elements.any():
-            non_string_indices = df[col][non_string_elements].index.tolist()
+        non_string_indices = _get_non_string_indices(df[col])
+        if non_string_indices:
             logger.error(
                 f"Column '{col}' contains non-string elements (e.g., numbers, lists, etc.) "
                 f"at indices: {non_string_indices}. Only string values can be checked against regex."
@@ -232,18 +234,32 @@ def drop_rows_not_satisfying_regex(
                 f"at indices: {non_string_indices}. Only string values can be checked against regex."
             )
 
-        # Identify rows to drop for the current column
-        for index, value in df[col].items():
-            # At this point, we've guaranteed 'value' is a non-null string
-            if not compiled_regex.search(value):
-                logger.info(
-                    f"DROPPING: Column '{col}', Row Index {index}: Value '{value}' "
-                    f"does NOT fully satisfy the regex '{regex_pattern}'."
-                )
-                rows_to_drop_indices.add(index)
-
-    if rows_to_drop_indices:
-        df = df.drop(index=list(rows_to_drop_indices))
+        # Identify rows to drop for the current column with a single pass over
+        # the raw values (guaranteed to be non-null strings at this point)
+        values = df[col].to_numpy()
+        search = compiled_regex.search
+        matches = np.fromiter(
+            (search(value) is not None for value in values),
+            dtype=bool,
+            count=initial_rows,
+        )
+        for position in np.flatnonzero(~matches):
+            # Per-row messages use loguru's deferred formatting, so no string is
+            # built when the logger is disabled or filtered above INFO.
+            logger.info(
+                "DROPPING: Column '{}', Row Index {}: Value '{}' "
+                "does NOT fully satisfy the regex '{}'.",
+                col,
+                df.index[position],
+                values[position],
+                regex_pattern,
+            )
+        keep_mask &= matches
+
+    if not keep_mask.all():
+        # Positional take avoids the boolean-indexer checks of df.loc[mask]
+        # and keeps the original index labels.
+        df = df.take(np.flatnonzero(keep_mask))
         dropped_count = initial_rows - len(df)
         logger.success(
             f"Finished dropping rows. Total {dropped_count} rows dropped based "
@@ -278,15 +294,13 @@ def drop_rows_with_non_positive_values(
                       non-positive values (negative or zero) in the specified columns.
 
     Raises:
-        ValueError: If a specified column is not found in the DataFrame,
-                    contains null values, or contains non-numeric elements.
+        ValueError: If a specified column is not found in the DataFrame, is not
+                    unique, contains null values, or contains non-numeric elements.
     """
 
     df = input_df.copy()
     initial_rows = len(df)
-    rows_to_drop_indices = set()
     columns_to_check_copy = columns_to_check.copy()
-    print(columns_to_check_copy)
 
     logger.info(
         f"Starting check for non-positive values (<= 0) in columns "
@@ -303,16 +317,25 @@ def drop_rows_with_non_positive_values(
                 f"Column '{col}' not found in the DataFrame. " "Cannot perform check."
             )
 
-        if df[col].empty:
-            logger.warning(
-                f"Column '{col}' is empty. "
-                "No checks will be performed on this column."
+        # A duplicated label selects several columns, which cannot be checked
+        # as one
+        if isinstance(df[col], pd.DataFrame):
+            logger.error(
+                f"Column '{col}' is not unique in the DataFrame. "
+                "Cannot perform check."
+            )
+            raise ValueError(
+                f"Column '{col}' is not unique in the DataFrame. "
+                "Cannot perform check."
             )
-            continue  # Skip this column and move to the next
+
+    for col in columns_to_check_copy:
+        column_values = df[col]
 
         # Check for null values
-        if df[col].isnull().any():
-            null_indices = df[col][df[col].isnull()].index.tolist()
+        null_mask = column_values.isna().to_numpy()
+        if null_mask.any():
+            null_indices = df.index[null_mask].tolist()
             logger.error(
                 f"Column '{col}' contains 'None' or missing values at indices: {null_indices}. "
                 "All values must be non-null for the check."
@@ -323,9 +346,9 @@ def drop_rows_with_non_positive_values(
             )
 
         # Check if all values are numeric (int or float)
-        if not is_numeric_dtype(df[col]):
-            non_numeric_indices = df[col][
-                ~pd.to_numeric(df[col], errors="coerce").notna()
+        if not is_numeric_dtype(column_values):
+            non_numeric_indices = column_values[
+                ~pd.to_numeric(column_values, errors="coerce").notna()
             ].index.tolist()
             logger.error(
                 f"Column '{col}' contains non-numeric elements (e.g., strings, lists, etc.) "
@@ -336,24 +359,28 @@ def drop_rows_with_non_positive_values(
                 f"at indices: {non_numeric_indices}. Only numeric values can be checked for being non-positive."
             )
 
-        # Identify rows to drop for the current column
-        # The change is here: using df[col] <= 0 to include zero
-        non_positive_value_indices = df.loc[df[col] <= 0, col].index.tolist()
+    # Identify rows to drop column by column (<= 0 includes zero). Each column
+    # is compared into one reusable row-sized buffer, so neither a 2-D float
+    # copy nor a 2-D boolean temporary is materialized for wide frames.
+    keep_mask = np.ones(initial_rows, dtype=bool)
+    non_positive_mask = np.empty(initial_rows, dtype=bool)
 
-        if non_positive_value_indices:
+    for col in columns_to_check_copy:
+        np.less_equal(df[col].to_numpy(dtype=np.float64), 0, out=non_positive_mask)
+        if non_positive_mask.any():
+            non_positive_value_indices = df.index[non_positive_mask].tolist()
             logger.info(
                 f"Found non-positive values (<= 0) in column '{col}' "
                 f"at indices: {non_positive_value_indices}"
             )
-            for index in non_positive_value_indices:
-                rows_to_drop_indices.add(index)
+            keep_mask[non_positive_mask] = False
 
-    if rows_to_drop_indices:
-        df_filtered = df.drop(index=list(rows_to_drop_indices))
+    if not keep_mask.all():
+        df_filtered = df.take(np.flatnonzero(keep_mask))
         dropped_count = initial_rows - len(df_filtered)
         logger.success(
             f"Finished dropping rows. Total {dropped_count} rows dropped due "
-            "to non-positive values. {len(df_filtered)} rows remaining."
+            f"to non-positive values. {len(df_filtered)} rows remaining."
         )
         return df_filtered
 
@@ -376,9 +403,10 @@ def drop_rows_if_no_column_matches_regex(
     the row is kept.
 
     This function first performs checks to ensure the specified columns exist,
-    contain no null values, and consist only of strings. It then iterates through
-    each row and, for each row, checks if any of the target columns' values match
-    the regex. Rows where no such match is found are dropped.
+    contain no null values, and consist only of strings. It then checks the target
+    columns one at a time, only searching rows that have not matched yet, and
+    keeps a row as soon as any column matches. Rows where no such match is found
+    are dropped.
 
     Args:
         input_df (NonEmptyDataFrame): The pandas DataFrame to check and modify.
@@ -397,7 +425,7 @@ def drop_rows_if_no_column_matches_regex(
     """
 
     df = input_df.copy()
-    compiled_regex = re.compile(regex_pattern, re.IGNORECASE | re.DOTALL)
+    compiled_regex = _compile_regex(regex_pattern)
     columns_to_check_copy = columns_to_check.copy()
 
     logger.info(
@@ -427,8 +455,9 @@ def drop_rows_if_no_column_matches_regex(
             )
             continue
 
-        if df[col].isnull().any():
-            null_indices = df[col][df[col].isnull()].index.tolist()
+        null_mask = df[col].isna().to_numpy()
+        if null_mask.any():
+            null_indices = df.index[null_mask].tolist()
             logger.error(
                 f"Column '{col}' contains 'None' or missing values at indices: {null_indices}. "
                 "All values must be non-null for regex check."
@@ -438,9 +467,8 @@ def drop_rows_if_no_column_matches_regex(
                 "All values must be non-null for regex check."
             )
 
-        non_string_elements = df[col].apply(lambda x: not isinstance(x, str))
-        if non_string_elements.any():
-            non_string_indices = df[col][non_string_elements].index.tolist()
+        non_string_indices = _get_non_string_indices(df[col])
+        if non_string_indices:
             logger.error(
                 f"Column '{col}' contains non-string elements (e.g., numbers, lists, etc.) "
                 f"at indices: {non_string_indices}. Only string values can be checked against regex."
@@ -450,37 +478,41 @@ def drop_rows_if_no_column_matches_regex(
                 f"at indices: {non_string_indices}. Only string values can be checked against regex."
             )
 
-    rows_to_keep_indices = []
-    dropped_count = 0
-
-    for index, row in df.iterrows():
-        keep_this_row = False
+    # OR the per-column matches into a keep-mask. Each column is only searched
+    # for the rows that no previous column has matched yet, and the scan stops
+    # as soon as every row is kept.
+    keep_mask = np.zeros(len(df), dtype=bool)
+    search = compiled_regex.search
 
-        for col in columns_to_check_copy:
-            if col not in row or pd.isna(row[col]) or not isinstance(row[col], str):
-                continue
-
-            cell_value = row[col]
-
-            if compiled_regex.search(cell_value):
-                keep_this_row = True
-                break
+    for col in columns_to_check_copy:
+        pending_positions = np.flatnonzero(~keep_mask)
+        if pending_positions.size == 0:
+            break
+        values = df[col].to_numpy()
+        keep_mask[pending_positions] = np.fromiter(
+            (search(values[position]) is not None for position in pending_positions),
+            dtype=bool,
+            count=pending_positions.size,
+        )
 
-        if keep_this_row:
-            rows_to_keep_indices.append(index)
-        else:
-            logger.info(
-                f"DROPPING: Row Index {index} because NONE of the columns ({columns_to_check_copy}) "
-                f"satisfied the regex '{regex_pattern}'."
-            )
-            dropped_count += 1
+    dropped_positions = np.flatnonzero(~keep_mask)
+    dropped_count = dropped_positions.size
+    for position in dropped_positions:
+        # Deferred formatting: nothing is built unless the message is emitted
+        logger.info(
+            "DROPPING: Row Index {} because NONE of the columns ({}) "
+            "satisfied the regex '{}'.",
+            df.index[position],
+            columns_to_check_copy,
+            regex_pattern,
+        )
 
-    df_filtered = df.loc[rows_to_keep_indices]
+    df_filtered = df.take(np.flatnonzero(keep_mask))
 
     if dropped_count > 0:
         logger.success(
             f"Finished filtering. Total {dropped_count} rows dropped. "
-            "{len(df_filtered)} rows remaining."
+            f"{len(df_filtered)} rows remaining."
         )
     else:
         logger.success(
@@ -549,7 +581,15 @@ def reduce_list_ints_to_unique(
         return list(dict.fromkeys(lst))
 
     try:
-        df[target_column] = df[target_column].apply(get_unique_elements_from_list)
+        # A single pass over the raw object array avoids the per-call overhead
+        # of Series.apply; the index is kept so values realign on assignment.
+        df[target_column] = pd.Series(
+            [
+                get_unique_elements_from_list(lst)
+                for lst in df[target_column].to_numpy()
+            ],
+            index=df.index,
+        )
         logger.success(
             f"Reduction complete: Column '{target_column}' "
             "now contains lists with only unique values."
@@ -585,9 +625,9 @@ def group_by_document_and_stack_types(
                                    (e.g., after unique reduction). Defaults to 'min_entities'.
 
     Returns:
-        pd.DataFrame: A new DataFrame with one row per unique document,
-                      `target_column` as a list of strings, and `min_entities_column`
-                      as a single list.
+        pd.DataFrame: A new DataFrame with one row per unique document (in order of
+                      first appearance), `target_column` as a list of strings, and
+                      `min_entities_column` as a single list.
 
     Raises:
         ValueError: If any required column (`document_id_column`, `target_column`,
@@ -605,21 +645,52 @@ def group_by_document_and_stack_types(
             logger.error(f"Required column '{col}' not found in the DataFrame.")
             raise ValueError(f"Required column '{col}' not found in the DataFrame.")
 
-    # Define the aggregation dictionary dynamically using all parameters
-    aggregation_funcs = {
-        target_column: lambda x: list(x.astype(str).unique()),
-        min_entities_column: "first",
-    }
-
     try:
-        # Perform the groupby and aggregation using the document_id_column parameter
-        grouped_df = df.groupby(document_id_column, as_index=False).agg(
-            aggregation_funcs
+        # Stringify and de-duplicate (document, target) pairs over the whole frame
+        # at once, so each group only has to be collected into a list instead of
+        # being converted and uniquified on its own. drop_duplicates keeps the
+        # first occurrence, so the stacked values keep their order of appearance.
+        unique_pairs = pd.DataFrame(
+            {
+                document_id_column: df[document_id_column],
+                target_column: df[target_column].astype(str),
+            }
+        ).drop_duplicates()
+
+        # Number the documents in order of first appearance (missing ids are
+        # dropped, as groupby does) and stable-sort the pairs by that number, so
+        # each document's targets form one contiguous run, still in order of
+        # appearance. Slicing the runs out avoids groupby's per-group agg(list).
+        codes, document_ids = pd.factorize(unique_pairs[document_id_column])
+        has_document_id = codes >= 0
+        codes = codes[has_document_id]
+        order = np.argsort(codes, kind="stable")
+        targets = unique_pairs[target_column].to_numpy()[has_document_id][order]
+        run_starts = np.flatnonzero(np.diff(codes[order])) + 1
+        stacked_targets = (
+            [run.tolist() for run in np.split(targets, run_starts)]
+            if targets.size
+            else []
         )
 
-        # Reorder columns for better readability, using the dynamic parameters
-        final_columns_order = [document_id_column, target_column, min_entities_column]
-        grouped_df = grouped_df[final_columns_order]
+        # Align the first value of every document to the ids numbered above by
+        # label rather than by position, so unused categories of a categorical
+        # id column cannot shift the values onto the wrong documents.
+        first_min_entities = (
+            df.groupby(document_id_column, sort=False, observed=True)[
+                min_entities_column
+            ]
+            .first()
+            .reindex(document_ids)
+            .to_numpy()
+        )
+        grouped_df = pd.DataFrame(
+            {
+                document_id_column: document_ids,
+                target_column: stacked_targets,
+                min_entities_column: first_min_entities,
+            }
+        )
 
         logger.success(
             f"Grouping completed. Reduced {len(df)} rows to {len(grouped_df)} unique documents."
@@ -8,7 +8,7 @@ missing values, empty strings, or negative numbers. These functions are designed
 to enforce data integrity and consistency before further processing.
 """
 
-import re
+from itertools import chain
 
 import numpy as np
 import pandas as pd
@@ -16,6 +16,10 @@ from pandas.api.types import is_numeric_dtype
 from pydantic import validate_call
 
 from llm_etl_pipeline.customized_logger import logger
+from llm_etl_pipeline.transformation.internal import (
+    _compile_regex,
+    _get_non_string_indices,
+)
 from llm_etl_pipeline.typings import NonEmptyDataFrame, NonEmptyListStr, RegexPattern
 
 
@@ -68,7 +72,18 @@ def verify_list_column_contains_only_ints(
             )
             continue
 
-        # Iterate through each row in the specified column
+        # Fast path: look at the types of all cells, then of all list elements
+        # flattened into one stream, each in a single C-level pass. Plain lists
+        # of plain ints need no per-element Python work.
+        cell_values = df[col_name].to_numpy()
+        if set(map(type, cell_values)) == {list} and set(
+            map(type, chain.from_iterable(cell_values))
+        ) <= {int}:
+            logger.info(f"Verification successful for column '{col_name}'.")
+            continue
+
+        # Otherwise, iterate through each row in the specified column to report
+        # the first offending cell or element
         for index, cell_value in df[col_name].items():
             # Check for missing values first using explicit checks for None and numpy.nan
             # This avoids the ambiguous truth value error if cell_value is an array-like NaN
@@ -161,8 +176,7 @@ def check_string_columns(
             logger.error(message)
             raise ValueError(message)
 
-        non_string_elements = df[col].apply(lambda x: not isinstance(x, str))
-        if non_string_elements.any():
+        if _get_non_string_indices(df[col]):
             message = (
                 f"ERROR: Column '{col}' contains non-string elements "
                 f"(e.g., numbers, lists, etc. stored as objects)."
@@ -212,7 +226,7 @@ def check_columns_satisfy_regex(
     df = input_df.copy()
     columns_to_check_copy = columns_to_check.copy()
 
-    compiled_regex = re.compile(regex_pattern, re.IGNORECASE | re.DOTALL)
+    compiled_regex = _compile_regex(regex_pattern)
 
     logger.info(
         f"Checking columns  '{columns_to_check_copy}' against regex: '{regex_pattern}'"
@@ -245,10 +259,8 @@ def check_columns_satisfy_regex(
             raise ValueError(message)
 
         # Check if all values are actually strings
-        # Using .apply and checking isinstance
-        non_string_elements = df[col].apply(lambda x: not isinstance(x, str))
-        if non_string_elements.any():
-            non_string_indices = df[col][non_string_elements].index.tolist()
+        non_string_indices = _get_non_string_indices(df[col])
+        if non_string_indices:
             message = (
                 f"Column '{col}' contains non-string elements (e.g., numbers, lists, etc.) "
                 f"at indices: {non_string_indices}. Only string values can be checked against regex."
@@ -285,10 +297,9 @@ def check_numeric_columns(
     Checks if specified columns in a pandas DataFrame contain only numeric values and no nulls.
 
     This function rigorously verifies each designated column to ensure it meets the following criteria:
-    1. The column exists within the DataFrame.
-    2. The column is not empty.
-    3. There are no null (e.g., `None` or `NaN`) values present in the column.
-    4. All values within the column are of a numeric data type (e.g., int, float).
+    1. The column exists within the DataFrame, under a unique label.
+    2. There are no null (e.g., `None` or `NaN`) values present in the column.
+    3. All values within the column are of a numeric data type (e.g., int, float).
 
     Args:
         input_df (NonEmptyDataFrame): The pandas DataFrame to be inspected.
@@ -300,7 +311,7 @@ def check_numeric_columns(
                       The returned DataFrame allows for method chaining if desired.
 
     Raises:
-        ValueError: If any column in `columns_to_check` is not found, is empty,
+        ValueError: If any column in `columns_to_check` is not found, is not unique,
                     contains null values, or contains any non-numeric data.
     """
     df = input_df.copy()
@@ -313,17 +324,19 @@ def check_numeric_columns(
             logger.error(f"Column '{col}' not found in the DataFrame.")
             raise ValueError(f"Column '{col}' not found in the DataFrame.")
 
-        if df[col].empty:
-            message = (
-                f"Column '{col}' is empty or contains only nulls. "
-                f"Cannot check an empty column for numeric values."
-            )
-            logger.error(message)
-            raise ValueError(message)
+        # A duplicated label selects several columns, which cannot be checked
+        # as one
+        if isinstance(df[col], pd.DataFrame):
+            logger.error(f"Column '{col}' is not unique in the DataFrame.")
+            raise ValueError(f"Column '{col}' is not unique in the DataFrame.")
+
+    for col in columns_to_check_copy:
+        column_values = df[col]
 
         # Check for null values
-        if df[col].isnull().any():
-            null_indices = df[col][df[col].isnull()].index.tolist()
+        null_mask = column_values.isna().to_numpy()
+        if null_mask.any():
+            null_indices = df.index[null_mask].tolist()
             message = (
                 f"Column '{col}' contains 'None' or missing values at indices: {null_indices}. "
                 f"All values must be non-null for numeric check."
@@ -332,11 +345,11 @@ def check_numeric_columns(
             raise ValueError(message)
 
         # Check for numeric data type
-        if not is_numeric_dtype(df[col]):
+        if not is_numeric_dtype(column_values):
             # If the entire column isn't numeric, find the specific non-numeric values
             non_numeric_values = [
                 value
-                for value in df[col]
+                for value in column_values
                 if not pd.isna(value) and not isinstance(value, (int, float))
             ]
 
@@ -362,7 +375,7 @@ def verify_no_empty_strings(input_df: NonEmptyDataFrame) -> pd.DataFrame:
     """
     Checks a pandas DataFrame for the presence of None values or empty strings and raises errors if found.
 
-    This function iterates through all columns of the input DataFrame.
+    This function inspects all columns of the input DataFrame at once.
     It performs the following checks:
     1. For columns with an 'object' dtype (typically strings), it checks for empty string values ('').
 
@@ -379,17 +392,25 @@ def verify_no_empty_strings(input_df: NonEmptyDataFrame) -> pd.DataFrame:
     """
     df = input_df.copy()
 
-    for column in df.columns:
-        # Check for empty strings only if the column is of object (string) type
-        if df[column].dtype == "object":
-            if (df[column] == "").any():
-                empty_string_indices = df[column][df[column] == ""].index.tolist()
-                message = (
-                    f"Column '{column}' contains empty strings ('') at indices: "
-                    f"{empty_string_indices}. Empty strings are not allowed."
-                )
-                logger.error(message)
-                raise ValueError(message)
+    # Check for empty strings only in object (string) type columns, comparing
+    # every cell of those columns in a single vectorized pass. Missing values
+    # (None, NaN, pd.NA) compare as not empty.
+    object_df = df.select_dtypes(include="object")
+    empty_string_matrix = object_df.eq("").to_numpy(dtype=bool, na_value=False)
+
+    if empty_string_matrix.any():
+        # Report the first offending column, as a column-by-column scan would
+        position = int(np.argmax(empty_string_matrix.any(axis=0)))
+        column = object_df.columns[position]
+        empty_string_indices = object_df.index[
+            empty_string_matrix[:, position]
+        ].tolist()
+        message = (
+            f"Column '{column}' contains empty strings ('') at indices: "
+            f"{empty_string_indices}. Empty strings are not allowed."
+        )
+        logger.error(message)
+        raise ValueError(message)
 
     logger.success(
         "Verification complete. No empty strings found in object type columns."
@@ -402,8 +423,9 @@ def verify_no_negatives(input_df: NonEmptyDataFrame) -> pd.DataFrame:
     """
     Checks a pandas DataFrame for the presence of negative values in its numeric columns.
 
-    This function iterates through all columns of the input DataFrame.
-    For each column identified as numeric, it verifies that no value is less than zero.
+    This function scans all numeric columns of the input DataFrame at once.
+    If any of them holds a value less than zero, it raises a `ValueError`
+    naming the first such column and the indices of its negative values.
 
     Args:
         input_df (NonEmptyDataFrame): The pandas DataFrame to check.
@@ -419,18 +441,23 @@ def verify_no_negatives(input_df: NonEmptyDataFrame) -> pd.DataFrame:
     df = input_df.copy()
     logger.info("Verifying DataFrame for negative values in numeric columns.")
 
-    for column in df.columns:
-        # Check for None values (NaN for numeric types, None for objects)
-        if is_numeric_dtype(df[column]):
-            # Exclude NaN values from the negative check to avoid false positives
-            if (df[column] < 0).any():
-                negative_indices = df[column][df[column] < 0].index.tolist()
-                message = (
-                    f"Found negative values in numeric column '{column}' at indices: "
-                    f"{negative_indices}. All numeric values must be non-negative."
-                )
-                logger.error(message)
-                raise ValueError(message)
+    numeric_df = df.loc[:, [is_numeric_dtype(dtype) for dtype in df.dtypes]]
+    # DataFrame.lt compares each consolidated dtype block in one go, without
+    # casting integers to float; NaN and pd.NA never count as negative
+    negative_matrix = numeric_df.lt(0).to_numpy(dtype=bool, na_value=False)
+    columns_with_negatives = negative_matrix.any(axis=0)
+    if columns_with_negatives.any():
+        position = int(columns_with_negatives.argmax())
+        column = numeric_df.columns[position]
+        negative_indices = numeric_df.index[
+            np.flatnonzero(negative_matrix[:, position])
+        ].tolist()
+        message = (
+            f"Found negative values in numeric column '{column}' at indices: "
+            f"{negative_indices}. All numeric values must be non-negative."
+        )
+        logger.error(message)
+        raise ValueError(message)
 
     logger.success(
         "No negative values found in numeric columns." " Verification successful."
@@ -443,8 +470,8 @@ def verify_no_missing_data(input_df: NonEmptyDataFrame) -> pd.DataFrame:
     """
     Checks a pandas DataFrame for the presence of any missing values (None or NaN).
 
-    This function iterates through all columns of the input DataFrame.
-    If any column is found to contain `None` or `NaN` values, it immediately
+    This function scans all columns of the input DataFrame at once.
+    If any column is found to contain `None` or `NaN` values, it
     raises a `ValueError` indicating the column and the indices where missing
     data was detected.
 
@@ -462,16 +489,21 @@ def verify_no_missing_data(input_df: NonEmptyDataFrame) -> pd.DataFrame:
     df = input_df.copy()
     logger.info("Verifying DataFrame for missing data (None or NaN values).")
 
-    for column in df.columns:
-        # Check for None values (NaN for numeric types, None for objects)
-        if df[column].isnull().any():
-            missing_indices = df[column][df[column].isnull()].index.tolist()
-            message = (
-                f"Found 'None' or missing values in column '{column}' at indices: "
-                f"{missing_indices}. No missing data is allowed."
-            )
-            logger.error(message)
-            raise ValueError(message)
+    # Check for None values (NaN for numeric types, None for objects) across
+    # all columns with a single 2-D scan
+    missing_matrix = df.isna().to_numpy()
+
+    if missing_matrix.any():
+        # Report the first offending column, as a column-by-column scan would
+        position = int(np.argmax(missing_matrix.any(axis=0)))
+        column = df.columns[position]
+        missing_indices = df.index[missing_matrix[:, position]].tolist()
+        message = (
+            f"Found 'None' or missing values in column '{column}' at indices: "
+            f"{missing_indices}. No missing data is allowed."
+        )
+        logger.error(message)
+        raise ValueError(message)
 
     logger.success("No missing data found in the DataFrame. Verification successful.")
     return df
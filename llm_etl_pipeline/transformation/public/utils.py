@@ -32,12 +32,11 @@ def load_df_from_json(json_path: str) -> pd.DataFrame:
     3. A list where the first element is a list of dictionaries, and the second element
        is a dictionary containing 'min_entities' (newest format).
 
-    The function extracts these 'results' into a DataFrame for each document and
-    then concatenates all document DataFrames into a single, unified DataFrame,
-    adding a 'document_id' column to track the origin of each row. For the newest
-    format, it also extracts 'min_entities' and adds it as a column to each row.
-    For the old format, the 'min_entities' column will NOT be explicitly added
-    to the document's DataFrame, and will appear as NaN/None after concatenation.
+    The function collects the 'results' items of all documents as rows, tagging each
+    with a 'document_id' to track its origin, and builds a single, unified DataFrame
+    from them in one go. For the newest format, it also extracts 'min_entities' and
+    adds it to each row. For the old format, 'min_entities' is NOT explicitly added
+    to the document's rows, and will appear as NaN/None in the final DataFrame.
 
     Args:
         json_path (str): The file path to the JSON file to be loaded.
@@ -67,7 +66,11 @@ def load_df_from_json(json_path: str) -> pd.DataFrame:
         logger.error(f"An unexpected error occurred while opening or loading JSON: {e}")
         raise
 
-    all_dfs = []
+    all_records = []
+    # Ordered set of column names, in the order a concat of per-document
+    # DataFrames would produce them
+    columns_order = {}
+    documents_count = 0
 
     if not isinstance(data, list):
         logger.warning(
@@ -147,34 +150,34 @@ def load_df_from_json(json_path: str) -> pd.DataFrame:
             )
             continue
 
-        try:
-            df = pd.DataFrame(processed_results_data)
-            df["document_id"] = document_id
+        # Tag the items as rows of this document; the single DataFrame built
+        # from all rows below is far cheaper than one DataFrame per document
+        # followed by a concat.
+        document_fields = {"document_id": document_id}
 
-            # Add min_entities column ONLY if data was extracted for it (i.e., new format)
-            if min_entities_list is not None:
-                df["min_entities"] = [min_entities_list] * len(df)
-                logger.info(
-                    f"Added 'min_entities' column for document_id: {document_id}."
-                )
-            else:
-                # IMPORTANT: For old format documents, 'min_entities' column is NOT added here.
-                # When concatenated, this column will appear as NaN for these rows.
-                logger.info(
-                    f"No 'min_entities' data found for document_id: {document_id}. Column will not be explicitly added for this document."
-                )
-
-            all_dfs.append(df)
-        except Exception as e:
-            logger.error(
-                f"Error creating DataFrame for document_id {document_id}: {e}. Skipping this document."
+        # Add min_entities ONLY if data was extracted for it (i.e., new format)
+        if min_entities_list is not None:
+            document_fields["min_entities"] = min_entities_list
+            logger.info(f"Added 'min_entities' column for document_id: {document_id}.")
+        else:
+            # IMPORTANT: For old format documents, 'min_entities' is NOT added here.
+            # In the final DataFrame, this column will appear as NaN for these rows.
+            logger.info(
+                f"No 'min_entities' data found for document_id: {document_id}. Column will not be explicitly added for this document."
             )
-            continue
 
-    if all_dfs:
-        final_df = pd.concat(all_dfs, ignore_index=True)
+        for item in processed_results_data:
+            columns_order.update(dict.fromkeys(item))
+        columns_order.update(dict.fromkeys(document_fields))
+        all_records.extend(
+            {**item, **document_fields} for item in processed_results_data
+        )
+        documents_count += 1
+
+    if all_records:
+        final_df = pd.DataFrame(all_records, columns=list(columns_order))
         logger.info(
-            f"Successfully concatenated {len(all_dfs)} DataFrames into a final DataFrame with {len(final_df)} rows."
+            f"Successfully built a final DataFrame with {len(final_df)} rows from {documents_count} documents."
         )
     else:
         final_df = pd.DataFrame()
@@ -24,8 +24,9 @@ from llm_etl_pipeline.typings import NonEmptyDataFrame
 
 
 # --- Tests for drop_rows_if_no_column_matches_regex ---
-# Fixture for a non-empty sample DataFrame
-@pytest.fixture
+# Fixtures for non-empty sample DataFrames. They are built once per module:
+# every function under test works on a copy of its input, so tests only read them.
+@pytest.fixture(scope="module")
 def sample_dataframe_general() -> NonEmptyDataFrame:
     return pd.DataFrame(
         {
@@ -43,7 +44,7 @@ def sample_dataframe_general() -> NonEmptyDataFrame:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_non_empty() -> NonEmptyDataFrame:
     return pd.DataFrame(
         {
@@ -104,6 +105,21 @@ class TestDropRowsWithNonPositiveValues:
         result_df = drop_rows_with_non_positive_values(input_df, columns_to_check)
         pd.testing.assert_frame_equal(result_df, expected_df)
 
+    def test_non_positive_values_across_multiple_columns(self):
+        """
+        Test case to check that a row is dropped when any of several mixed
+        int/float columns holds a non-positive value.
+        """
+        input_df = NonEmptyDataFrame(
+            {"A": [1, 2, 3, 4], "B": [1.5, 0.0, 2.5, 3.5], "C": [-1, -2, -3, -4]}
+        )
+        columns_to_check = ["A", "B"]
+        expected_df = NonEmptyDataFrame(
+            {"A": [1, 3, 4], "B": [1.5, 2.5, 3.5], "C": [-1, -3, -4]}, index=[0, 2, 3]
+        )
+        result_df = drop_rows_with_non_positive_values(input_df, columns_to_check)
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
     def test_column_not_found(self):
         """
         Test case to verify that a ValueError is raised when a specified column
@@ -134,6 +150,22 @@ class TestDropRowsWithNonPositiveValues:
         with pytest.raises(ValueError, match="non-numeric elements"):
             drop_rows_with_non_positive_values(input_df, columns_to_check)
 
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [[1, 5, "x"], [2, 6, "y"]],  # string column behind the duplicate
+            [[1, 5, 0], [2, -6, 7]],  # numeric data that would be misfiltered
+        ],
+    )
+    def test_duplicate_column_label(self, rows):
+        """
+        Test case to verify that a label shared by several columns is rejected
+        instead of shifting the checks onto the wrong columns.
+        """
+        input_df = NonEmptyDataFrame(rows, columns=["A", "A", "B"])
+        with pytest.raises(ValueError, match="Column 'A' is not unique"):
+            drop_rows_with_non_positive_values(input_df, ["A", "B"])
+
     def test_dataframe_with_float_values(self):
         """
         Test case to verify the correct behavior when dealing with float values,
@@ -149,6 +181,19 @@ class TestDropRowsWithNonPositiveValues:
         result_df = drop_rows_with_non_positive_values(input_df, columns_to_check)
         pd.testing.assert_frame_equal(result_df, expected_df)
 
+    def test_duplicate_index_labels_drop_only_offending_rows(self):
+        """
+        Test case to verify that rows are dropped by position, so a row sharing
+        its index label with a non-positive row is kept.
+        """
+        input_df = NonEmptyDataFrame(
+            {"A": [1, -1, 3], "B": [10, 20, 30]}, index=[0, 0, 1]
+        )
+        columns_to_check = ["A"]
+        expected_df = NonEmptyDataFrame({"A": [1, 3], "B": [10, 30]}, index=[0, 1])
+        result_df = drop_rows_with_non_positive_values(input_df, columns_to_check)
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
 
 class TestDropRowsNotSatisfyingRegex:
     """
@@ -257,6 +302,20 @@ class TestDropRowsNotSatisfyingRegex:
         )
         pd.testing.assert_frame_equal(result_df, expected_df)
 
+    def test_drop_rows_not_satisfying_regex_categorical_column(self):
+        """
+        Test that a categorical column holding only strings is filtered like an
+        object column of strings.
+        """
+        df = pd.DataFrame(
+            {
+                "col_id": [1, 2, 3],
+                "value": pd.Categorical(["apple_123", "banana_xyz", "apple_123"]),
+            }
+        )
+        result_df = drop_rows_not_satisfying_regex(df, ["value"], r"^\w+_(\d{3})$")
+        pd.testing.assert_frame_equal(result_df, df.iloc[[0, 2]])
+
     def test_drop_rows_not_satisfying_regex_empty_dataframe_raises_validation_error(
         self,
     ):
@@ -364,6 +423,16 @@ class TestCheckColumnsSatisfyRegex:
         result_df = check_columns_satisfy_regex(df, columns_to_check, regex_pattern)
         pd.testing.assert_frame_equal(result_df, df)
 
+    def test_check_columns_satisfy_regex_categorical_success(self):
+        """
+        Test that a categorical column holding only strings is accepted.
+        """
+        df = pd.DataFrame(
+            {"codes": pd.Categorical(["ABC123", "XYZ789", "ABC123"])},
+        )
+        result_df = check_columns_satisfy_regex(df, ["codes"], r"^[A-Z]{3}\d{3}$")
+        pd.testing.assert_frame_equal(result_df, df)
+
     def test_check_columns_satisfy_regex_column_not_found_raises_value_error(self):
         """
         Test that a ValueError is raised if a specified column is not in the DataFrame.
@@ -491,6 +560,36 @@ class TestCheckStringColumns:
         result_df = check_string_columns(df, columns_to_check)
         pd.testing.assert_frame_equal(result_df, df)
 
+    def test_check_string_columns_string_dtype_success(self):
+        """
+        Test that columns using the pandas StringDtype are accepted.
+        """
+        df = pd.DataFrame(
+            {
+                "name": pd.array(["Alice", "Bob", "Charlie"], dtype="string"),
+                "value": [10.5, 20.0, 30.1],
+            }
+        )
+        result_df = check_string_columns(df, ["name"])
+        pd.testing.assert_frame_equal(result_df, df)
+
+    def test_check_string_columns_categorical_success(self):
+        """
+        Test that a categorical column holding only strings is accepted.
+        """
+        df = pd.DataFrame({"name": pd.Categorical(["Alice", "Bob", "Alice"])})
+        result_df = check_string_columns(df, ["name"])
+        pd.testing.assert_frame_equal(result_df, df)
+
+    def test_check_string_columns_string_dtype_null_raises_value_error(self):
+        """
+        Test that a missing value in a StringDtype column is still rejected.
+        """
+        df = pd.DataFrame({"name": pd.array(["Alice", pd.NA, "Bob"], dtype="string")})
+        with pytest.raises(ValueError) as excinfo:
+            check_string_columns(df, ["name"])
+        assert "'None'" in str(excinfo.value)
+
     def test_check_string_columns_column_not_found_raises_value_error(self):
         """
         Test that a ValueError is raised if a specified column is not in the DataFrame.
@@ -595,6 +694,16 @@ class TestCheckNumericColumns:
             check_numeric_columns(sample_non_empty, columns_to_check)
         assert "not found" in str(excinfo.value)
 
+    def test_check_numeric_columns_duplicate_column_label_raises_value_error(self):
+        """
+        Test that a label shared by several columns is rejected instead of
+        shifting the checks onto the wrong columns.
+        """
+        df = pd.DataFrame([[1, 5, "x"], [2, 6, "y"]], columns=["A", "A", "B"])
+        with pytest.raises(ValueError) as excinfo:
+            check_numeric_columns(df, ["A", "B"])
+        assert "Column 'A' is not unique" in str(excinfo.value)
+
     def test_check_numeric_columns_empty_column_raises_value_error(self):
         """
         Test that a ValueError is raised if a specified column is empty.
@@ -695,6 +804,40 @@ class TestVerifyNoEmptyStrings:
         )
         assert expected_error_message in str(excinfo.value)
 
+    def test_missing_values_are_not_empty_strings(self):
+        """
+        Test that None and pd.NA cells in object columns are not treated as empty
+        strings, while an empty string next to them is still reported.
+        """
+        df = pd.DataFrame({"col1": ["value1", pd.NA, None]}, dtype=object)
+        result_df = verify_no_empty_strings(df)
+        pd.testing.assert_frame_equal(result_df, df)
+
+        df_with_empty = pd.DataFrame({"col1": [pd.NA, "", "value3"]}, dtype=object)
+        with pytest.raises(ValueError) as excinfo:
+            verify_no_empty_strings(df_with_empty)
+        assert "at indices: [1]" in str(excinfo.value)
+
+    def test_empty_string_reports_first_offending_column(self):
+        """
+        Test that the first object column holding empty strings is reported,
+        and that list cells are not mistaken for empty strings.
+        """
+        df = pd.DataFrame(
+            {
+                "col1": ["a", "b", "c"],
+                "col2": [[1], [2], [3]],
+                "col3": ["x", "", ""],
+                "col4": ["", "y", "z"],
+            }
+        )
+        with pytest.raises(ValueError) as excinfo:
+            verify_no_empty_strings(df)
+
+        assert "Column 'col3' contains empty strings ('') at indices: [1, 2]." in str(
+            excinfo.value
+        )
+
     def test_empty_dataframe_raises_validation_error_empty_strings(self):
         """
         Test that an empty DataFrame raises a ValidationError for verify_no_empty_strings
@@ -834,6 +977,26 @@ class TestVerifyNoNegatives:
         result_df = verify_no_negatives(df)
         pd.testing.assert_frame_equal(result_df, df)
 
+    def test_nullable_integer_column_with_negatives_raises_value_error(self):
+        """
+        Test that negatives are found in nullable integer columns holding pd.NA,
+        and that the first offending column in column order is reported.
+        """
+        df = pd.DataFrame(
+            {
+                "text_col": ["a", "b", "c"],
+                "col_int": pd.array([pd.NA, -1, -3], dtype="Int64"),
+                "col_float": [-1.0, 2.0, 3.0],
+            }
+        )
+        with pytest.raises(ValueError) as excinfo:
+            verify_no_negatives(df)
+
+        expected_error_message = (
+            "negative values in numeric column 'col_int' at indices: [1, 2]."
+        )
+        assert expected_error_message in str(excinfo.value)
+
     def test_non_numeric_columns_are_ignored(self):
         """
         Test that non-numeric columns with values that might look negative (e.g., strings)
@@ -962,6 +1125,18 @@ class TestDropRowsIfNoColumnMatchesRegex:
             )
         assert "contains non-string elements" in str(excinfo.value)
 
+    def test_categorical_string_column(self):
+        """Tests that a categorical column holding only strings is matched like an
+        object column of strings."""
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "text_col": pd.Categorical(["apple", "kiwi", "apple"]),
+            }
+        )
+        result_df = drop_rows_if_no_column_matches_regex(df, ["text_col"], r"apple")
+        pd.testing.assert_frame_equal(result_df, df.iloc[[0, 2]])
+
     def test_column_containing_nan_raises_error(
         self, sample_dataframe_general: NonEmptyDataFrame
     ):
@@ -983,6 +1158,29 @@ class TestDropRowsIfNoColumnMatchesRegex:
         assert "[0]" in str(excinfo.value)
 
 
+# --- Tests for the PROJECT_REGEX_BACKEND switch ---
+class TestRegexBackend:
+
+    def test_re2_backend_matches_re_semantics(self, monkeypatch):
+        """The RE2 backend keeps the case-insensitive and DOTALL behavior."""
+        pytest.importorskip("re2")
+        monkeypatch.setenv("PROJECT_REGEX_BACKEND", "re2")
+        df = pd.DataFrame({"description": ["Hello world", "another\nLine", "x"]})
+
+        result_df = drop_rows_if_no_column_matches_regex(
+            df, ["description"], r"hello|another.line"
+        )
+        pd.testing.assert_frame_equal(result_df, df.iloc[[0, 1]])
+
+    def test_re2_unsupported_pattern_falls_back_to_re(self, monkeypatch):
+        """Patterns RE2 cannot compile (e.g. backreferences) fall back to re."""
+        monkeypatch.setenv("PROJECT_REGEX_BACKEND", "re2")
+        df = pd.DataFrame({"col": ["aa", "ab", "bb"]})
+
+        result_df = drop_rows_if_no_column_matches_regex(df, ["col"], r"(a)\1")
+        pd.testing.assert_frame_equal(result_df, df.iloc[[0]])
+
+
 # --- Tests for verify_list_column_contains_only_ints ---
 class TestVerifyListColumnContainsOnlyInts:
 
@@ -1002,6 +1200,12 @@ class TestVerifyListColumnContainsOnlyInts:
         result_df = verify_list_column_contains_only_ints(df, ["list1", "list2"])
         pd.testing.assert_frame_equal(result_df, df)
 
+    def test_bool_and_empty_lists_are_accepted(self):
+        """Tests that empty lists and int subclasses (bool) pass, as before."""
+        df = pd.DataFrame({"data": [[], [True, 2], [3]]})
+        result_df = verify_list_column_contains_only_ints(df, ["data"])
+        pd.testing.assert_frame_equal(result_df, df)
+
     def test_column_not_found_raises_error(
         self, sample_dataframe_general: NonEmptyDataFrame
     ):
@@ -1012,41 +1216,23 @@ class TestVerifyListColumnContainsOnlyInts:
             )
         assert "Column 'non_existent_list_col' not found" in str(excinfo.value)
 
-    def test_column_contains_none_raises_error(
-        self, sample_dataframe_general: NonEmptyDataFrame
-    ):
-        """Raises ValueError if a column contains None."""
-        df = pd.DataFrame({"data": [[1], None, [2]]})
-        with pytest.raises(ValueError) as excinfo:
-            verify_list_column_contains_only_ints(df, ["data"])
-        assert "contains a missing value (NaN/None) at index 1" in str(excinfo.value)
-
-    def test_column_contains_nan_raises_error(
-        self, sample_dataframe_general: NonEmptyDataFrame
-    ):
-        """Raises ValueError if a column contains np.nan."""
-        df = pd.DataFrame({"data": [[1], np.nan, [2]]})
-        with pytest.raises(ValueError) as excinfo:
-            verify_list_column_contains_only_ints(df, ["data"])
-        assert "contains a missing value (NaN/None) at index 1" in str(excinfo.value)
-
-    def test_column_contains_non_list_elements_raises_error(
-        self, sample_dataframe_general: NonEmptyDataFrame
-    ):
-        """Raises ValueError if a column contains non-list elements."""
-        df = pd.DataFrame({"data": [[1], "not a list", [2]]})
-        with pytest.raises(ValueError) as excinfo:
-            verify_list_column_contains_only_ints(df, ["data"])
-        assert "is not a list" in str(excinfo.value)
-
-    def test_list_contains_non_integer_elements_raises_error(
-        self, sample_dataframe_general: NonEmptyDataFrame
-    ):
-        """Raises ValueError if a list contains non-integer elements."""
-        df = pd.DataFrame({"data": [[1, 2], [3, "a"], [4]]})
+    @pytest.mark.parametrize(
+        "data, expected_error_message",
+        [
+            ([[1], None, [2]], "contains a missing value (NaN/None) at index 1"),
+            ([[1], np.nan, [2]], "contains a missing value (NaN/None) at index 1"),
+            ([[1], "not a list", [2]], "is not a list"),
+            ([[1, 2], [3, "a"], [4]], "is not an integer. Found value: a"),
+        ],
+        ids=["none", "nan", "non_list_element", "non_integer_element"],
+    )
+    def test_invalid_cell_raises_error(self, data, expected_error_message):
+        """Raises ValueError if a cell is missing, is not a list, or holds a
+        non-integer element."""
+        df = pd.DataFrame({"data": data})
         with pytest.raises(ValueError) as excinfo:
             verify_list_column_contains_only_ints(df, ["data"])
-        assert "is not an integer. Found value: a" in str(excinfo.value)
+        assert expected_error_message in str(excinfo.value)
 
     # Removed test_empty_column_is_skipped as it was attempting to test unreachable code
     # given the NonEmptyDataFrame input type.
@@ -1180,6 +1366,94 @@ class TestGroupByDocumentAndStackTypes:
         )
         pd.testing.assert_frame_equal(result_df, expected_df)
 
+    def test_documents_keep_first_appearance_order(self):
+        """Tests that grouped documents keep the order in which they first appear."""
+        df = pd.DataFrame(
+            {
+                "document_id": ["docC", "docA", "docC", "docB"],
+                "target": ["tag1", "tag2", "tag3", "tag4"],
+                "min_entities": [[3], [1], [3], [2]],
+            }
+        )
+
+        result_df = group_by_document_and_stack_types(df, "target")
+
+        expected_df = pd.DataFrame(
+            {
+                "document_id": ["docC", "docA", "docB"],
+                "target": [["tag1", "tag3"], ["tag2"], ["tag4"]],
+                "min_entities": [[3], [1], [2]],
+            }
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_min_entities_taken_from_rows_with_duplicate_targets(self):
+        """Tests that the first non-null min_entities is kept even if its row only
+        repeats a target value already stacked for that document."""
+        df = pd.DataFrame(
+            {
+                "document_id": ["docA", "docA", "docB"],
+                "target": ["tag1", "tag1", "tag2"],
+                "min_entities": [None, [1], [2]],
+            }
+        )
+
+        result_df = group_by_document_and_stack_types(df, "target")
+
+        expected_df = pd.DataFrame(
+            {
+                "document_id": ["docA", "docB"],
+                "target": [["tag1"], ["tag2"]],
+                "min_entities": [[1], [2]],
+            }
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_categorical_document_ids_with_unused_categories(self):
+        """Tests that min_entities stays aligned with categorical document ids
+        whose categories are not all present in the data."""
+        df = pd.DataFrame(
+            {
+                "document_id": pd.Categorical(
+                    ["b", "a", "b"], categories=["a", "b", "c"]
+                ),
+                "target": ["tag1", "tag2", "tag3"],
+                "min_entities": [[2], [1], [2]],
+            }
+        )
+
+        result_df = group_by_document_and_stack_types(df, "target")
+
+        expected_df = pd.DataFrame(
+            {
+                "document_id": pd.Categorical(["b", "a"], categories=["a", "b", "c"]),
+                "target": [["tag1", "tag3"], ["tag2"]],
+                "min_entities": [[2], [1]],
+            }
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_rows_without_document_id_are_dropped(self):
+        """Tests that rows with a missing document id do not form a group."""
+        df = pd.DataFrame(
+            {
+                "document_id": ["docB", None, "docA", "docB"],
+                "target": ["tag1", "tag2", "tag3", "tag4"],
+                "min_entities": [[2], [9], [1], [2]],
+            }
+        )
+
+        result_df = group_by_document_and_stack_types(df, "target")
+
+        expected_df = pd.DataFrame(
+            {
+                "document_id": ["docB", "docA"],
+                "target": [["tag1", "tag4"], ["tag3"]],
+                "min_entities": [[2], [1]],
+            }
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
     def test_required_column_not_found_raises_error(
         self, sample_dataframe_general: NonEmptyDataFrame
     ):
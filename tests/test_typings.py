@@ -1,9 +1,6 @@
-from pathlib import Path
-from unittest.mock import patch  # <-- Add this import
-
 import pandas as pd
 import pytest
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from llm_etl_pipeline.typings import (
     ExtractionType,
@@ -30,554 +27,140 @@ class MyConfig(BaseModel):
     lang: LanguageRequirement = "en"
 
 
-class TestCustomTypes:
-
-    def test_non_zero_int(self):
-        # Valid cases
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).id
-            == 1
-        )
-        assert (
-            MyConfig(
-                id=100,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).id
-            == 100
-        )
-
-        # Invalid cases
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=0,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=-5,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id="abc",
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
+# Valid values for every MyConfig field; each test overrides only the field it
+# exercises.
+BASE_KWARGS = {
+    "id": 1,
+    "name": "a",
+    "tags": ["a"],
+    "data": pd.DataFrame([1]),
+    "pattern": ".",
+    "ref_depth": "paragraphs",
+    "ext_type": "money",
+    "model_id": "sat-1l",
+}
+
+
+def _make_config(**overrides) -> MyConfig:
+    return MyConfig(**{**BASE_KWARGS, **overrides})
+
+
+# Adapters validating a single alias, so valid values are checked without
+# running the validators of every other MyConfig field
+NON_ZERO_INT_ADAPTER = TypeAdapter(NonZeroInt)
+NON_EMPTY_STR_ADAPTER = TypeAdapter(NonEmptyStr)
+NON_EMPTY_LIST_STR_ADAPTER = TypeAdapter(NonEmptyListStr)
+NON_EMPTY_DATAFRAME_ADAPTER = TypeAdapter(NonEmptyDataFrame)
+REGEX_PATTERN_ADAPTER = TypeAdapter(RegexPattern)
+REFERENCE_DEPTH_ADAPTER = TypeAdapter(ReferenceDepth)
+EXTRACTION_TYPE_ADAPTER = TypeAdapter(ExtractionType)
+SAT_MODEL_ID_ADAPTER = TypeAdapter(SaTModelId)
+LANGUAGE_REQUIREMENT_ADAPTER = TypeAdapter(LanguageRequirement)
+
+# (field, value) pairs that MyConfig must reject
+INVALID_CASES = [
+    ("id", 0),
+    ("id", -5),
+    ("id", "abc"),
+    ("name", ""),
+    ("name", "   "),
+    ("name", None),
+    ("tags", []),  # list empty
+    ("tags", [""]),  # list contains empty string
+    ("tags", ["  "]),
+    ("tags", [1]),
+    ("tags", None),
+    ("data", pd.DataFrame()),  # empty DataFrame
+    ("data", pd.DataFrame(columns=["col1"])),  # columns but no rows
+    ("data", pd.DataFrame(index=[0, 1])),  # rows but no columns
+    ("data", [1, 2, 3]),  # not a DataFrame
+    ("data", None),
+    ("pattern", "["),  # invalid regex syntax
+    ("pattern", "*"),
+    ("pattern", ""),  # empty string, handled by NonEmptyStr
+    ("pattern", None),
+    ("ref_depth", "words"),
+    ("ref_depth", 123),
+    ("ref_depth", None),
+    ("ext_type", "other"),
+    ("ext_type", None),
+    ("ext_type", 12),
+    ("lang", "fr"),
+    ("lang", None),
+    ("lang", 12),
+]
 
-    def test_non_empty_str(self):
-        # Valid cases
-        assert (
-            MyConfig(
-                id=1,
-                name="hello",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).name
-            == "hello"
-        )
-        assert (
-            MyConfig(
-                id=1,
-                name="  abc  ",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).name
-            == "abc"
-        )  # Should be stripped
 
-        # Invalid cases
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="   ",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name=None,
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-
-    def test_non_empty_list_str(self):
-        # Valid cases
-        assert MyConfig(
-            id=1,
-            name="a",
-            tags=["item1"],
-            data=pd.DataFrame([1]),
-            pattern=".",
-            ref_depth="paragraphs",
-            ext_type="money",
-            model_id="sat-1l",
-        ).tags == ["item1"]
-        assert MyConfig(
-            id=1,
-            name="a",
-            tags=[" item2 ", "item3"],
-            data=pd.DataFrame([1]),
-            pattern=".",
-            ref_depth="paragraphs",
-            ext_type="money",
-            model_id="sat-1l",
-        ).tags == ["item2", "item3"]
-
-        # Invalid cases (list empty)
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=[],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        # Invalid cases (list contains empty string)
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=[""],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["  "],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=[1],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=None,
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
+class TestCustomTypes:
 
-    def test_non_empty_dataframe(self):
-        # Valid cases
+    def test_valid_config(self):
+        # End-to-end check that the aliases compose into a model
+        config = _make_config(name="  a  ", tags=[" a "])
+        assert config.model_dump(exclude={"data"}) == {
+            **{k: v for k, v in BASE_KWARGS.items() if k != "data"},
+            "lang": "en",
+        }
+        assert config.data.equals(BASE_KWARGS["data"])
+
+    @pytest.mark.parametrize("value, expected", [(1, 1), (100, 100)])
+    def test_non_zero_int_valid(self, value, expected):
+        assert NON_ZERO_INT_ADAPTER.validate_python(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("hello", "hello"),
+            ("  abc  ", "abc"),  # Should be stripped
+        ],
+    )
+    def test_non_empty_str_valid(self, value, expected):
+        assert NON_EMPTY_STR_ADAPTER.validate_python(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (["item1"], ["item1"]),
+            ([" item2 ", "item3"], ["item2", "item3"]),
+        ],
+    )
+    def test_non_empty_list_str_valid(self, value, expected):
+        assert NON_EMPTY_LIST_STR_ADAPTER.validate_python(value) == expected
+
+    def test_non_empty_dataframe_valid(self):
         df_non_empty = pd.DataFrame({"col1": [1, 2]})
-        assert MyConfig(
-            id=1,
-            name="a",
-            tags=["a"],
-            data=df_non_empty,
-            pattern=".",
-            ref_depth="paragraphs",
-            ext_type="money",
-            model_id="sat-1l",
-        ).data.equals(df_non_empty)
-
-        # Invalid cases (empty DataFrame)
-        df_empty = pd.DataFrame()
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=df_empty,
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        # Invalid cases (not a DataFrame)
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=[1, 2, 3],
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=None,
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
+        # The validator passes the frame through unchanged, without copying it
+        assert NON_EMPTY_DATAFRAME_ADAPTER.validate_python(df_non_empty) is df_non_empty
 
-    def test_regex_pattern(self):
-        # Valid cases
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern="^abc$",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).pattern
-            == "^abc$"
-        )
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern="\d+",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).pattern
-            == "\d+"
-        )
+    @pytest.mark.parametrize("value", ["^abc$", r"\d+"])
+    def test_regex_pattern_valid(self, value):
+        assert REGEX_PATTERN_ADAPTER.validate_python(value) == value
 
-        # Invalid cases (invalid regex syntax)
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern="[",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern="*",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        # Invalid cases (empty string, handled by NonEmptyStr)
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern="",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
+    @pytest.mark.parametrize("value", ["paragraphs", "sentences"])
+    def test_reference_depth_valid(self, value):
+        assert REFERENCE_DEPTH_ADAPTER.validate_python(value) == value
 
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=None,
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            )
+    @pytest.mark.parametrize("value", ["money", "entity"])
+    def test_extraction_type_valid(self, value):
+        assert EXTRACTION_TYPE_ADAPTER.validate_python(value) == value
 
-    def test_reference_depth(self):
-        # Valid cases
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).ref_depth
-            == "paragraphs"
-        )
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="sentences",
-                ext_type="money",
-                model_id="sat-1l",
-            ).ref_depth
-            == "sentences"
-        )
-
-        # Invalid cases
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="words",
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth=123,
-                ext_type="money",
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth=None,
-                ext_type="money",
-                model_id="sat-1l",
-            )
-
-    def test_extraction_type(self):
-        # Valid cases
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).ext_type
-            == "money"
-        )
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="entity",
-                model_id="sat-1l",
-            ).ext_type
-            == "entity"
-        )
-
-        # Invalid cases
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="other",
-                model_id="sat-1l",
-            )
-
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type=None,
-                model_id="sat-1l",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type=12,
-                model_id="sat-1l",
-            )
-
-    def test_sat_model_id(self):
+    @pytest.mark.parametrize("value", ["sat-1l", "sat-12l-sm"])
+    def test_sat_model_id_valid(self, value):
         # Valid StandardSaTModelId
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-            ).model_id
-            == "sat-1l"
-        )
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-12l-sm",
-            ).model_id
-            == "sat-12l-sm"
-        )
-
-    def test_language_requirement(self):
-        # Valid case
-        assert (
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-                lang="en",
-            ).lang
-            == "en"
-        )
-
-        # Invalid case
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-                lang="fr",
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-                lang=None,
-            )
-        with pytest.raises(ValidationError):
-            MyConfig(
-                id=1,
-                name="a",
-                tags=["a"],
-                data=pd.DataFrame([1]),
-                pattern=".",
-                ref_depth="paragraphs",
-                ext_type="money",
-                model_id="sat-1l",
-                lang=12,
-            )
+        assert SAT_MODEL_ID_ADAPTER.validate_python(value) == value
+
+    def test_language_requirement_valid(self):
+        assert LANGUAGE_REQUIREMENT_ADAPTER.validate_python("en") == "en"
+
+    def test_model_construct_skips_validation(self):
+        # model_construct is the trusted-data fast path: no validators run, but
+        # defaults are still applied
+        config = MyConfig.model_construct(**{**BASE_KWARGS, "id": "not-an-int"})
+        assert config.id == "not-an-int"
+        assert config.lang == "en"
+
+    @pytest.mark.parametrize("field, value", INVALID_CASES)
+    def test_invalid_value_raises_error(self, field, value):
+        with pytest.raises(ValidationError) as excinfo:
+            _make_config(**{field: value})
+        # Only the overridden field may fail; the base values are all valid
+        assert {error["loc"][0] for error in excinfo.value.errors()} == {field}